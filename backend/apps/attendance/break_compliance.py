@@ -4,7 +4,8 @@ Handles break reminders, waivers, and compliance tracking
 """
 from django.utils import timezone
 from django.db import transaction
-from datetime import timedelta
+from django.db.models import Count, Exists, OuterRef, Q
+from datetime import datetime, time, timedelta
 from celery import shared_task
 import logging
 
@@ -63,21 +64,20 @@ class BreakComplianceManager:
         current_time = timezone.now()
         hours_worked = (current_time - time_log.clock_in_time).total_seconds() / 3600
 
-        # Get completed break numbers (including waived)
-        taken_breaks = set(
-            Break.objects.filter(time_log=time_log, break_number__isnull=False)
-            .values_list('break_number', flat=True)
+        # Fetch all break numbers for this log in one query; legacy breaks
+        # (no break_number) come back as None
+        break_numbers = list(
+            Break.objects.filter(time_log=time_log).values_list('break_number', flat=True)
         )
 
-        # Also count legacy breaks (no break_number) by order for backward compat
-        legacy_breaks = Break.objects.filter(
-            time_log=time_log, break_number__isnull=True
-        ).order_by('start_time')
+        # Get completed break numbers (including waived)
+        taken_breaks = {number for number in break_numbers if number is not None}
+
+        # Also count legacy breaks by order for backward compat
+        legacy_count = break_numbers.count(None)
         next_legacy_slot = len(taken_breaks) + 1
-        for lb in legacy_breaks:
-            if next_legacy_slot <= 3:
-                taken_breaks.add(next_legacy_slot)
-                next_legacy_slot += 1
+        for slot in range(next_legacy_slot, min(next_legacy_slot + legacy_count, 4)):
+            taken_breaks.add(slot)
 
         all_done = taken_breaks >= {1, 2, 3}
 
@@ -237,27 +237,38 @@ class BreakComplianceManager:
         if not date:
             date = timezone.now().date()
         
-        # Get time logs for the date
+        # Get time logs for the date. A half-open range on clock_in_time
+        # (local midnight to next local midnight) matches __date but lets the
+        # (employee, clock_in_time) index be used instead of casting each row.
+        day_start = timezone.make_aware(datetime.combine(date, time.min))
+        day_end = timezone.make_aware(datetime.combine(date + timedelta(days=1), time.min))
+        # Break tallies are aggregated alongside each log rather than with
+        # three separate queries per log
         time_logs = TimeLog.objects.filter(
             employee=employee,
-            clock_in_time__date=date
+            clock_in_time__gte=day_start,
+            clock_in_time__lt=day_end
+        ).annotate(
+            breaks_count=Count('breaks'),
+            lunch_breaks_count=Count('breaks', filter=Q(breaks__break_type='LUNCH')),
+            waived_breaks_count=Count('breaks', filter=Q(breaks__notes__icontains='WAIVED')),
         )
         
         compliance_data = []
         
         for time_log in time_logs:
-            if not time_log.duration_hours:
+            # duration_hours is recomputed on every access; read it once
+            shift_duration = time_log.duration_hours
+            if not shift_duration:
                 continue  # Skip incomplete logs
             
-            breaks_taken = Break.objects.filter(time_log=time_log)
-            
             status = {
                 'time_log_id': time_log.id,
-                'shift_duration': time_log.duration_hours,
-                'breaks_required': time_log.duration_hours >= 6,
-                'breaks_taken': breaks_taken.count(),
-                'lunch_break_taken': breaks_taken.filter(break_type='LUNCH').exists(),
-                'breaks_waived': breaks_taken.filter(notes__icontains='WAIVED').count(),
+                'shift_duration': shift_duration,
+                'breaks_required': shift_duration >= 6,
+                'breaks_taken': time_log.breaks_count,
+                'lunch_break_taken': time_log.lunch_breaks_count > 0,
+                'breaks_waived': time_log.waived_breaks_count,
                 'is_compliant': True,
                 'compliance_notes': []
             }
@@ -282,19 +293,27 @@ def check_break_reminders():
     try:
         compliance_manager = BreakComplianceManager()
         
-        # Get all currently clocked-in employees
+        # Get all currently clocked-in employees. Role and user are read for
+        # every log (is_driver, notifications) and the open-break check is
+        # folded into the same query instead of one EXISTS per log.
         active_logs = TimeLog.objects.filter(
             status='CLOCKED_IN',
             clock_in_time__isnull=False
-        ).select_related('employee')
+        ).select_related('employee__role', 'employee__user').annotate(
+            on_break=Exists(
+                Break.objects.filter(time_log=OuterRef('pk'), end_time__isnull=True)
+            )
+        )
         
         reminders_sent = 0
+        # One reference time for the whole sweep
+        current_time = timezone.now()
         
         for time_log in active_logs:
             employee = time_log.employee
             
             # Skip if employee is on break
-            if Break.objects.filter(time_log=time_log, end_time__isnull=True).exists():
+            if time_log.on_break:
                 continue
             
             # Check break requirements
@@ -303,7 +322,6 @@ def check_break_reminders():
             if requirements['requires_break']:
                 # Check if we've already sent a reminder recently (within last hour)
                 last_reminder_time = time_log.break_reminder_sent_at
-                current_time = timezone.now()
 
                 should_send_reminder = (
                     not last_reminder_time or
@@ -422,12 +440,15 @@ def generate_break_compliance_report(date=None):
         
         compliance_manager = BreakComplianceManager()
         
-        # Get all active employees
-        employees = Employee.objects.filter(employment_status='ACTIVE')
+        # Get all active employees; evaluated once so the total doesn't
+        # need a separate COUNT query before the loop
+        employees = list(
+            Employee.objects.filter(employment_status='ACTIVE').select_related('user')
+        )
         
         compliance_summary = {
             'date': date.isoformat(),
-            'total_employees': employees.count(),
+            'total_employees': len(employees),
             'employees_worked': 0,
             'compliant_employees': 0,
             'non_compliant_employees': 0,
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-17 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0008_add_emergency_break_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='timelog',
+            index=models.Index(fields=['employee', 'clock_in_time'], name='attendance__employe_005385_idx'),
+        ),
+    ]
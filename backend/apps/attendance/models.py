@@ -2,6 +2,7 @@
 Simple Attendance models for WorkSync
 """
 from django.db import models
+from django.utils.functional import cached_property
 from apps.employees.models import Employee, Location
 import uuid
 
@@ -159,9 +160,13 @@ class TimeLog(models.Model):
         hours = self.duration_hours
         return hours and hours > 8
 
-    @property
+    @cached_property
     def scheduled_shift(self):
-        """Get the scheduled shift that corresponds to this time log"""
+        """
+        Get the scheduled shift that corresponds to this time log.
+        Cached per instance: attendance_status, is_shift_compliant and the
+        serializer all read it, so a serialized row only queries shifts once.
+        """
         from apps.scheduling.models import Shift
 
         # Find shift that overlaps with this time log
@@ -234,6 +239,9 @@ class TimeLog(models.Model):
     
     class Meta:
         ordering = ['-clock_in_time']
+        indexes = [
+            models.Index(fields=['employee', 'clock_in_time']),
+        ]
 
 
 class Break(models.Model):
@@ -5,6 +5,7 @@ Prevents and detects employees who remain clocked in for extended periods
 from django.utils import timezone
 from django.db import transaction
 from datetime import timedelta
+from collections import Counter
 from celery import shared_task
 import logging
 
@@ -242,12 +243,20 @@ class StuckClockInManager:
     def get_stuck_clockin_dashboard_data(self):
         """Get dashboard data for stuck clock-ins"""
         stuck_logs = self.find_stuck_clockins()
+
+        # Tally severities and pending auto clock-outs in a single pass
+        severity_counts = Counter()
+        auto_clockout_needed = 0
+        for log in stuck_logs:
+            severity_counts[log['severity']] += 1
+            if log['needs_action']:
+                auto_clockout_needed += 1
         
         return {
             'total_stuck': len(stuck_logs),
-            'warning_level': len([log for log in stuck_logs if log['severity'] == 'WARNING']),
-            'critical_level': len([log for log in stuck_logs if log['severity'] == 'CRITICAL']),
-            'auto_clockout_needed': len([log for log in stuck_logs if log['needs_action']]),
+            'warning_level': severity_counts['WARNING'],
+            'critical_level': severity_counts['CRITICAL'],
+            'auto_clockout_needed': auto_clockout_needed,
             'stuck_employees': [
                 {
                     'employee_id': log['employee'].employee_id,
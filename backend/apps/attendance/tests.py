@@ -1,18 +1,23 @@
 """
-Tests for Unscheduled Clock-in Feature
+Tests for the Attendance app
 
 Verifies that employees can clock in/out without a scheduled shift
 via Portal (clock_in), QR scan (qr_scan), and that shift_status
-correctly reports is_unscheduled.
+correctly reports is_unscheduled. Also covers break compliance
+(break requirements, the reminder sweep and daily compliance status)
+and the per-log scheduled shift lookup.
 """
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.utils import timezone
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.employees.models import Employee, Role, Location
-from apps.attendance.models import TimeLog
+from apps.attendance.models import TimeLog, Break
+from apps.attendance.break_compliance import BreakComplianceManager, check_break_reminders
+from apps.attendance.serializers import TimeLogSerializer
 from apps.scheduling.models import Shift
 
 
@@ -221,3 +226,123 @@ class TestUnscheduledRoundTrip(UnscheduledClockInTestBase):
         self.assertIsNotNone(log)
         self.assertEqual(log.attendance_status, 'UNSCHEDULED')
 
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# 5. Break requirements (BreakComplianceManager)
+# ═══════════════════════════════════════════════════════════════════════
+class TestBreakRequirements(UnscheduledClockInTestBase):
+    """get_break_requirements should combine numbered and legacy breaks."""
+
+    def setUp(self):
+        super().setUp()
+        self.manager = BreakComplianceManager()
+        self.time_log = TimeLog.objects.create(
+            employee=self.employee,
+            clock_in_time=timezone.now() - timedelta(hours=5),
+            status='CLOCKED_IN',
+        )
+
+    def _add_break(self, break_number=None):
+        start = timezone.now() - timedelta(hours=1)
+        return Break.objects.create(
+            time_log=self.time_log, break_type='SHORT', break_number=break_number,
+            start_time=start, end_time=start + timedelta(minutes=10),
+        )
+
+    def test_no_breaks_prompts_first_break(self):
+        reqs = self.manager.get_break_requirements(self.employee, self.time_log)
+        self.assertTrue(reqs['requires_break'])
+        self.assertEqual(reqs['break_number'], 1)
+        self.assertEqual(reqs['breaks_taken'], [])
+
+    def test_numbered_breaks_are_taken(self):
+        self._add_break(1)
+        self._add_break(2)
+        reqs = self.manager.get_break_requirements(self.employee, self.time_log)
+        self.assertEqual(reqs['breaks_taken'], [1, 2])
+        self.assertFalse(reqs['requires_break'])  # break 3 triggers at 6h
+
+    def test_legacy_breaks_fill_next_slots(self):
+        self._add_break(1)
+        self._add_break()
+        reqs = self.manager.get_break_requirements(self.employee, self.time_log)
+        self.assertEqual(reqs['breaks_taken'], [1, 2])
+
+    def test_legacy_breaks_capped_at_three_slots(self):
+        for _ in range(4):
+            self._add_break()
+        reqs = self.manager.get_break_requirements(self.employee, self.time_log)
+        self.assertEqual(reqs['breaks_taken'], [1, 2, 3])
+        self.assertTrue(reqs['has_met_max_breaks'])
+
+    def test_single_query_regardless_of_break_count(self):
+        self._add_break(1)
+        for _ in range(3):
+            self._add_break()
+        with self.assertNumQueries(1):
+            self.manager.get_break_requirements(self.employee, self.time_log)
+
+    def _run_reminder_sweep(self):
+        """Run check_break_reminders with the requirement check stubbed out."""
+        with patch.object(
+            BreakComplianceManager, 'check_break_requirements',
+            return_value={'requires_break': False},
+        ) as check:
+            with self.assertNumQueries(1):
+                check_break_reminders()
+        return check
+
+    def test_reminder_sweep_skips_log_with_open_break(self):
+        Break.objects.create(
+            time_log=self.time_log, break_type='SHORT', break_number=1,
+            start_time=timezone.now() - timedelta(minutes=5),
+        )
+        check = self._run_reminder_sweep()
+        check.assert_not_called()
+
+    def test_reminder_sweep_checks_log_with_closed_break(self):
+        self._add_break(1)
+        check = self._run_reminder_sweep()
+        check.assert_called_once_with(self.employee, self.time_log)
+
+    def test_compliance_status_tallies_breaks_in_one_query(self):
+        lunch = self._add_break(2)
+        lunch.break_type = 'LUNCH'
+        lunch.save()
+        waived = self._add_break(1)
+        waived.notes = 'WAIVED by employee'
+        waived.save()
+        date = timezone.localtime(self.time_log.clock_in_time).date()
+
+        with self.assertNumQueries(1):
+            statuses = self.manager.get_compliance_status(self.employee, date)
+
+        self.assertEqual(len(statuses), 1)
+        self.assertEqual(statuses[0]['breaks_taken'], 2)
+        self.assertTrue(statuses[0]['lunch_break_taken'])
+        self.assertEqual(statuses[0]['breaks_waived'], 1)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# 6. Scheduled shift lookup on TimeLog
+# ═══════════════════════════════════════════════════════════════════════
+class TestScheduledShiftLookup(UnscheduledClockInTestBase):
+    """Serializing a completed log should look up its shift only once."""
+
+    def test_scheduled_shift_queried_once_per_log(self):
+        shift = self._create_current_shift()
+        log = TimeLog.objects.create(
+            employee=self.employee,
+            clock_in_time=shift.start_time,
+            clock_out_time=shift.end_time,
+            status='CLOCKED_OUT',
+        )
+        log = TimeLog.objects.select_related('employee__user').get(pk=log.pk)
+
+        with self.assertNumQueries(1):
+            data = TimeLogSerializer(log).data
+
+        self.assertEqual(data['scheduled_shift_id'], str(shift.id))
+        self.assertEqual(data['attendance_status'], 'COMPLETED')
+        self.assertTrue(data['is_shift_compliant'])
@@ -581,18 +581,21 @@ class TimeLogViewSet(viewsets.ModelViewSet):
 
         from apps.scheduling.models import Shift
 
+        # Single reference time for every duration/offset in the response
+        now = timezone.now()
+
         # Get current and upcoming shifts — reuse results to avoid
         # redundant DB queries (get_clockin_eligible_shift internally
         # calls get_current_shift again, so we inline the logic).
-        current_shift = Shift.get_current_shift(employee)
-        upcoming_shift = Shift.get_upcoming_shift(employee, within_minutes=60)
+        current_shift = Shift.get_current_shift(employee, now=now)
+        upcoming_shift = Shift.get_upcoming_shift(employee, within_minutes=60, now=now)
         # Inline the logic of get_clockin_eligible_shift to avoid
         # calling get_current_shift a second time:
         if current_shift:
             clockin_eligible_shift = current_shift
         else:
-            upcoming_15 = Shift.get_upcoming_shift(employee, within_minutes=15)
-            clockin_eligible_shift = upcoming_15 if (upcoming_15 and upcoming_15.allows_clock_in) else None
+            upcoming_15 = Shift.get_upcoming_shift(employee, within_minutes=15, now=now)
+            clockin_eligible_shift = upcoming_15 if (upcoming_15 and upcoming_15.allows_clock_in_at(now)) else None
 
         # Check current clock-in status
         active_log = TimeLog.objects.filter(
@@ -609,10 +612,10 @@ class TimeLogViewSet(viewsets.ModelViewSet):
             'is_unscheduled': not bool(clockin_eligible_shift),  # Flag for frontend warning
             'clock_in_time': active_log.clock_in_time if active_log else None,
             'clock_in_location': active_log.clock_in_location.name if active_log and active_log.clock_in_location else None,
-            'duration_minutes': int((timezone.now() - active_log.clock_in_time).total_seconds() / 60) if active_log else None,
-            'duration_hours': round((timezone.now() - active_log.clock_in_time).total_seconds() / 3600, 2) if active_log else None,
+            'duration_minutes': int((now - active_log.clock_in_time).total_seconds() / 60) if active_log else None,
+            'duration_hours': round((now - active_log.clock_in_time).total_seconds() / 3600, 2) if active_log else None,
             'shift_enforcement_enabled': True,
-            'current_time': timezone.now().isoformat(),
+            'current_time': now.isoformat(),
         }
 
         # Helper function to convert shift times to naive Los Angeles time
@@ -638,7 +641,7 @@ class TimeLogViewSet(viewsets.ModelViewSet):
                 'start_time': get_la_time_naive(current_shift.start_time),
                 'end_time': get_la_time_naive(current_shift.end_time),
                 'location': current_shift.location,
-                'is_current': current_shift.is_current,
+                'is_current': current_shift.is_current_at(now),
             }
 
         if upcoming_shift:
@@ -647,7 +650,7 @@ class TimeLogViewSet(viewsets.ModelViewSet):
                 'start_time': get_la_time_naive(upcoming_shift.start_time),
                 'end_time': get_la_time_naive(upcoming_shift.end_time),
                 'location': upcoming_shift.location,
-                'minutes_until_start': int((upcoming_shift.start_time - timezone.now()).total_seconds() / 60),
+                'minutes_until_start': int((upcoming_shift.start_time - now).total_seconds() / 60),
             }
 
         return Response(data)
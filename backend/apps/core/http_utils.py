@@ -0,0 +1,29 @@
+"""
+Shared HTTP client utilities for WorkSync application
+"""
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+
+
+def build_session(headers=None):
+    """
+    Build a pooled requests.Session that never stores cookies.
+
+    Sessions here are shared process-wide across unrelated endpoints, so a
+    Set-Cookie from one receiver must not be replayed to the next one; with
+    no allowed domains the cookie jar rejects every cookie it is offered.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+# Shared session for outbound webhooks: static headers are set once and the
+# underlying connection pool is reused across deliveries in a process.
+webhook_session = build_session({
+    'Content-Type': 'application/json',
+    'User-Agent': 'WorkSync-Webhook/1.0',
+})
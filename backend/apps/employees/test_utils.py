@@ -0,0 +1,46 @@
+"""
+Shared fixtures for API tests
+
+Provides an EMPLOYEE role, a staff admin authenticated via JWT, an employee
+factory and a query-count helper for N+1 regression guards.
+"""
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.employees.models import Employee, Role
+
+
+class AdminAPITestBase(TestCase):
+    """Shared setup: EMPLOYEE role, staff admin, JWT auth."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.role = Role.objects.create(name='EMPLOYEE', permissions={})
+        cls.admin = User.objects.create_user(
+            username='admin', password='pass', is_staff=True
+        )
+
+    def setUp(self):
+        token = RefreshToken.for_user(self.admin)
+        self.client.defaults['HTTP_AUTHORIZATION'] = f'Bearer {token.access_token}'
+
+    # ── helpers ──────────────────────────────────────────────────────────
+    @classmethod
+    def _create_employee(cls, index):
+        user = User.objects.create_user(
+            username=f'emp{index}', password='pass', first_name='Emp', last_name=str(index)
+        )
+        return Employee.objects.create(
+            user=user, employee_id=f'EMP-{index:03d}', role=cls.role,
+            hire_date='2024-01-01',
+        )
+
+    def _get_with_query_count(self, url):
+        """GET url as the admin; return (queries executed, decoded JSON)."""
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        return len(ctx.captured_queries), resp.json()
@@ -0,0 +1,29 @@
+"""
+Tests for the Employee API
+
+Guards the employee list endpoint against N+1 query regressions: the
+serializer reads user and role for every row, so the number of queries
+must not grow with the number of employees.
+"""
+from apps.employees.test_utils import AdminAPITestBase
+
+
+class EmployeeListQueryCountTest(AdminAPITestBase):
+    """GET /employees/ should issue a constant number of queries."""
+
+    url = '/api/v1/employees/'
+
+    def _create_employees(self, count, offset=0):
+        for i in range(offset, offset + count):
+            self._create_employee(i)
+
+    def test_query_count_independent_of_employee_count(self):
+        self._create_employees(2)
+        small_queries, small_rows = self._get_with_query_count(self.url)
+
+        self._create_employees(5, offset=2)
+        large_queries, large_rows = self._get_with_query_count(self.url)
+
+        self.assertEqual(len(small_rows), 2)
+        self.assertEqual(len(large_rows), 7)
+        self.assertEqual(small_queries, large_queries)
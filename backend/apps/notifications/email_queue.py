@@ -54,8 +54,10 @@ class EmailQueue:
         }
         
         filepath = os.path.join(cls.QUEUE_DIR, filename)
+        # Serialize up front so the queue file is written in a single call
+        payload = json.dumps(email_data, indent=2)
         with open(filepath, 'w') as f:
-            json.dump(email_data, f, indent=2)
+            f.write(payload)
         
         return email_id
     
@@ -124,4 +126,5 @@ class EmailQueue:
     def get_queue_count(cls):
         """Get number of emails in queue"""
         cls.ensure_queue_dir()
-        return len([f for f in os.listdir(cls.QUEUE_DIR) if f.endswith('.json')])
+        with os.scandir(cls.QUEUE_DIR) as entries:
+            return sum(1 for entry in entries if entry.name.endswith('.json'))
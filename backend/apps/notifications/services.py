@@ -9,15 +9,21 @@ from django.core.mail import send_mail
 from django.conf import settings
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
-import requests
+from requests.adapters import HTTPAdapter
 import json
 
 from apps.employees.models import Employee
 from apps.core.timezone_utils import convert_to_naive_la_time
+from apps.core.http_utils import build_session
 from .models import NotificationTemplate, NotificationLog
 
 logger = logging.getLogger(__name__)
 
+# Shared session for Twilio API calls so consecutive SMS sends reuse a pooled
+# HTTPS connection instead of paying a new TCP/TLS handshake each time.
+twilio_session = build_session()
+twilio_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
 
 class NotificationService:
     """Service for sending automated notifications"""
@@ -180,7 +186,7 @@ class NotificationService:
                 'Body': message
             }
 
-            response = requests.post(
+            response = twilio_session.post(
                 url,
                 data=data,
                 auth=(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
@@ -10,6 +10,7 @@ from datetime import timedelta
 
 from .models import WebhookSubscription, WebhookDelivery, NotificationLog
 from apps.employees.models import Employee
+from apps.core.http_utils import webhook_session
 
 logger = logging.getLogger('worksync.notifications')
 
@@ -50,15 +51,13 @@ def send_single_webhook(self, delivery_id):
     Send a single webhook notification
     """
     try:
-        delivery = WebhookDelivery.objects.get(id=delivery_id)
+        delivery = WebhookDelivery.objects.select_related('subscription').get(id=delivery_id)
         delivery.attempt_count += 1
         delivery.status = 'RETRYING' if delivery.attempt_count > 1 else 'PENDING'
         delivery.save()
 
-        # Prepare headers
+        # Prepare per-delivery headers (defaults come from webhook_session)
         headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'WorkSync-Webhook/1.0',
             'X-WorkSync-Event': delivery.event_type,
             'X-WorkSync-Delivery': str(delivery.id),
         }
@@ -68,7 +67,7 @@ def send_single_webhook(self, delivery_id):
             headers['X-WorkSync-Signature'] = delivery.subscription.secret_key
 
         # Send webhook
-        response = requests.post(
+        response = webhook_session.post(
             delivery.subscription.target_url,
             json=delivery.payload,
             headers=headers,
@@ -0,0 +1,65 @@
+"""
+Tests for outbound webhook delivery
+
+send_single_webhook posts through a process-wide shared session, so it must
+not carry state (cookies) from one subscriber's response into the next
+delivery.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import TestCase
+
+from apps.notifications.models import WebhookSubscription, WebhookDelivery
+from apps.notifications.tasks import send_single_webhook
+
+
+class _CookieSettingHandler(BaseHTTPRequestHandler):
+    """Records each request's Cookie header and always sets a cookie."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.cookie_headers.append(self.headers.get('Cookie'))
+        self.send_response(200)
+        self.send_header('Set-Cookie', f'sid={self.path.strip("/")}; Path=/')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WebhookSessionCookieTest(TestCase):
+    """A cookie set by one subscriber is never sent to another."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _CookieSettingHandler)
+        cls.server.cookie_headers = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def _deliver(self, path):
+        subscription = WebhookSubscription.objects.create(
+            event_type='employee.clocked_in', target_url=f'{self.base_url}/{path}',
+        )
+        delivery = WebhookDelivery.objects.create(
+            subscription=subscription, event_type='employee.clocked_in', payload={},
+        )
+        send_single_webhook(str(delivery.id))
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.status, 'SUCCESS')
+
+    def test_second_delivery_carries_no_cookie(self):
+        self.server.cookie_headers.clear()
+        self._deliver('hookA')
+        self._deliver('hookB')
+
+        self.assertEqual(self.server.cookie_headers, [None, None])
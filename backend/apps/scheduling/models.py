@@ -60,8 +60,10 @@ class Shift(models.Model):
     @property
     def is_current(self):
         """Check if shift is currently active"""
-        now = timezone.now()
+        return self.is_current_at(timezone.now())
 
+    def is_current_at(self, now):
+        """Check if shift is active at the given time"""
         # Handle overnight shifts
         if self.end_time <= self.start_time:
             # Overnight shift - check if current time is after start OR before end (next day)
@@ -78,7 +80,10 @@ class Shift(models.Model):
     @property
     def allows_clock_in(self):
         """Check if current time allows clock-in (within 15 minutes before shift start)"""
-        now = timezone.now()
+        return self.allows_clock_in_at(timezone.now())
+
+    def allows_clock_in_at(self, now):
+        """Check if the given time allows clock-in (within 15 minutes before shift start)"""
         clock_in_window_start = self.start_time - timedelta(minutes=15)
 
         # Handle overnight shifts
@@ -103,9 +108,10 @@ class Shift(models.Model):
             return self.start_time <= now
 
     @classmethod
-    def get_current_shift(cls, employee):
+    def get_current_shift(cls, employee, now=None):
         """Get the current active shift for an employee"""
-        now = timezone.now()
+        if now is None:
+            now = timezone.now()
 
         # Only check shifts that could plausibly be active right now:
         # - Regular shifts: start_time <= now <= end_time
@@ -122,15 +128,16 @@ class Shift(models.Model):
 
         # Check each shift to see if it's currently active
         for shift in shifts:
-            if shift.is_current:
+            if shift.is_current_at(now):
                 return shift
 
         return None
 
     @classmethod
-    def get_upcoming_shift(cls, employee, within_minutes=15):
+    def get_upcoming_shift(cls, employee, within_minutes=15, now=None):
         """Get the next upcoming shift for an employee within specified minutes"""
-        now = timezone.now()
+        if now is None:
+            now = timezone.now()
         upcoming_window = now + timedelta(minutes=within_minutes)
         return cls.objects.filter(
             employee=employee,
@@ -140,14 +147,17 @@ class Shift(models.Model):
         ).first()
 
     @classmethod
-    def get_clockin_eligible_shift(cls, employee):
+    def get_clockin_eligible_shift(cls, employee, now=None):
         """Get shift that allows clock-in (current or upcoming within 15 minutes)"""
-        current_shift = cls.get_current_shift(employee)
+        if now is None:
+            now = timezone.now()
+
+        current_shift = cls.get_current_shift(employee, now=now)
         if current_shift:
             return current_shift
 
-        upcoming_shift = cls.get_upcoming_shift(employee, within_minutes=15)
-        if upcoming_shift and upcoming_shift.allows_clock_in:
+        upcoming_shift = cls.get_upcoming_shift(employee, within_minutes=15, now=now)
+        if upcoming_shift and upcoming_shift.allows_clock_in_at(now):
             return upcoming_shift
 
         return None
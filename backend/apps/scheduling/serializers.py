@@ -9,7 +9,9 @@ from .models import Shift, ShiftTemplate
 from .leave_models import LeaveType, LeaveBalance, LeaveRequest, LeaveApprovalWorkflow
 from apps.employees.models import Employee, Location
 from apps.employees.serializers import EmployeeSerializer, LocationSerializer
-from apps.core.timezone_utils import convert_to_user_timezone, convert_from_user_timezone, parse_user_datetime
+from apps.core.timezone_utils import (
+    convert_to_user_timezone, convert_from_user_timezone, convert_to_naive_la_time, parse_user_datetime
+)
 
 
 class ShiftSerializer(serializers.ModelSerializer):
@@ -38,39 +40,14 @@ class ShiftSerializer(serializers.ModelSerializer):
 
     def get_start_time_local(self, obj):
         """Get start time in Los Angeles timezone - NO CONVERSIONS"""
-        if obj.start_time:
-            import pytz
-
-            la_tz = pytz.timezone('America/Los_Angeles')
-
-            # Convert to LA time if timezone-aware, or localize if naive
-            if obj.start_time.tzinfo:
-                la_time = obj.start_time.astimezone(la_tz)
-            else:
-                la_time = la_tz.localize(obj.start_time)
-
-            # Return WITHOUT timezone info to prevent frontend conversion
-            naive_la_time = la_time.replace(tzinfo=None)
-            return naive_la_time.isoformat()
-        return None
+        # Returned WITHOUT timezone info to prevent frontend conversion
+        naive_la_time = convert_to_naive_la_time(obj.start_time)
+        return naive_la_time.isoformat() if naive_la_time else None
 
     def get_end_time_local(self, obj):
         """Get end time in Los Angeles timezone - NO CONVERSIONS"""
-        if obj.end_time:
-            import pytz
-
-            la_tz = pytz.timezone('America/Los_Angeles')
-
-            # Convert to LA time if timezone-aware, or localize if naive
-            if obj.end_time.tzinfo:
-                la_time = obj.end_time.astimezone(la_tz)
-            else:
-                la_time = la_tz.localize(obj.end_time)
-
-            # Return WITHOUT timezone info to prevent frontend conversion
-            naive_la_time = la_time.replace(tzinfo=None)
-            return naive_la_time.isoformat()
-        return None
+        naive_la_time = convert_to_naive_la_time(obj.end_time)
+        return naive_la_time.isoformat() if naive_la_time else None
 
     class Meta:
         model = Shift
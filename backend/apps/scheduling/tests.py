@@ -0,0 +1,80 @@
+"""
+Tests for Shift Conflict Detection
+
+Covers ShiftViewSet.conflicts: which shift pairs are reported as
+overlapping, the order of conflicts_with, and that the number of queries
+does not grow with the number of shifts.
+"""
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.employees.test_utils import AdminAPITestBase
+from apps.scheduling.models import Shift
+
+
+class ShiftConflictsTest(AdminAPITestBase):
+    """GET /scheduling/shifts/conflicts/ reports same-employee overlaps."""
+
+    url = '/api/v1/scheduling/shifts/conflicts/'
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.emp1 = cls._create_employee(1)
+        cls.emp2 = cls._create_employee(2)
+        cls.base = timezone.now().replace(microsecond=0) + timedelta(days=1)
+
+    # ── helpers ──────────────────────────────────────────────────────────
+    def _create_shifts(self, employee, *spans):
+        """
+        Create shifts from (start_hour, end_hour) offsets. bulk_create skips
+        Shift.clean(), which would otherwise reject the overlaps under test.
+        """
+        return Shift.objects.bulk_create([
+            Shift(
+                employee=employee,
+                start_time=self.base + timedelta(hours=start),
+                end_time=self.base + timedelta(hours=end),
+                is_published=True,
+                created_by=self.admin,
+            )
+            for start, end in spans
+        ])
+
+    def _get_conflicts(self):
+        return self._get_with_query_count(self.url)[1]
+
+    # ── tests ────────────────────────────────────────────────────────────
+    def test_overlapping_shifts_reported_newest_first(self):
+        early, middle, late = self._create_shifts(self.emp1, (0, 4), (1, 5), (3, 7))
+
+        conflicts = {c['shift']['id']: c for c in self._get_conflicts()}
+
+        self.assertEqual(set(conflicts), {str(early.id), str(middle.id), str(late.id)})
+        # (0, 4) overlaps both others; listed by -start_time
+        self.assertEqual(
+            [other['id'] for other in conflicts[str(early.id)]['conflicts_with']],
+            [str(late.id), str(middle.id)],
+        )
+
+    def test_back_to_back_shifts_not_reported(self):
+        self._create_shifts(self.emp1, (0, 4), (4, 8))
+
+        self.assertEqual(self._get_conflicts(), [])
+
+    def test_same_time_different_employees_not_reported(self):
+        self._create_shifts(self.emp1, (0, 4))
+        self._create_shifts(self.emp2, (0, 4))
+
+        self.assertEqual(self._get_conflicts(), [])
+
+    def test_query_count_independent_of_shift_count(self):
+        self._create_shifts(self.emp1, (0, 4), (2, 6))
+        small_queries, small_conflicts = self._get_with_query_count(self.url)
+
+        self._create_shifts(self.emp2, (0, 4), (2, 6), (10, 14), (12, 16))
+        large_queries, large_conflicts = self._get_with_query_count(self.url)
+
+        self.assertEqual(len(small_conflicts), 2)
+        self.assertEqual(len(large_conflicts), 6)
+        self.assertEqual(small_queries, large_queries)
@@ -10,6 +10,7 @@ from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from datetime import datetime, timedelta, time
+from collections import defaultdict
 from .models import Shift, ShiftTemplate
 from apps.employees.models import Employee, Location
 from .serializers import (
@@ -358,17 +359,33 @@ class ShiftViewSet(viewsets.ModelViewSet):
         """Get shifts with scheduling conflicts"""
         conflicts = []
 
-        # Find overlapping shifts for the same employee
-        shifts = Shift.objects.select_related('employee').order_by('employee', 'start_time')
+        # Find overlapping shifts for the same employee. Shifts are loaded
+        # once, grouped by employee and sorted by start_time, so each shift
+        # only needs comparing with the later shifts that start before it
+        # ends; the scan stops at the first one that doesn't. Stored shifts
+        # always end after they start (overnight ends are moved to the next
+        # day by the shift serializers), which the early stop relies on.
+        shifts = list(
+            Shift.objects.select_related('employee__user', 'created_by')
+            .order_by('employee', 'start_time')
+        )
+        overlaps = defaultdict(list)
+        for i, shift in enumerate(shifts):
+            for j in range(i + 1, len(shifts)):
+                other = shifts[j]
+                if other.employee_id != shift.employee_id or other.start_time >= shift.end_time:
+                    break
+                if other.end_time > shift.start_time:
+                    # Overlap is symmetric: record it for both shifts
+                    overlaps[shift.id].append(other)
+                    overlaps[other.id].append(shift)
 
         for shift in shifts:
-            overlapping = Shift.objects.filter(
-                employee=shift.employee,
-                start_time__lt=shift.end_time,
-                end_time__gt=shift.start_time
-            ).exclude(id=shift.id)
+            overlapping = overlaps.get(shift.id)
 
-            if overlapping.exists():
+            if overlapping:
+                # Same order the Shift queryset would return (-start_time)
+                overlapping.sort(key=lambda other: other.start_time, reverse=True)
                 conflicts.append({
                     'shift': ShiftSerializer(shift).data,
                     'conflicts_with': ShiftSerializer(overlapping, many=True).data
@@ -1,4 +1,3 @@
-import requests
 import json
 import hashlib
 import hmac
@@ -19,6 +18,7 @@ from .serializers import (
     BulkWebhookActionSerializer
 )
 from apps.employees.permissions import IsAdminUser
+from apps.core.http_utils import webhook_session
 
 
 class WebhookEndpointViewSet(viewsets.ModelViewSet):
@@ -223,11 +223,8 @@ class WebhookEndpointViewSet(viewsets.ModelViewSet):
     
     def _send_webhook(self, endpoint, payload, event_type):
         """Send webhook to endpoint"""
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'WorkSync-Webhook/1.0',
-            **endpoint.headers
-        }
+        # Per-endpoint headers only; defaults come from webhook_session
+        headers = dict(endpoint.headers)
         
         # Add authentication
         if endpoint.auth_type == 'bearer' and endpoint.auth_credentials.get('token'):
@@ -246,7 +243,7 @@ class WebhookEndpointViewSet(viewsets.ModelViewSet):
             headers['X-Webhook-Signature'] = f'sha256={signature}'
         
         # Send request
-        response = requests.post(
+        response = webhook_session.post(
             endpoint.url,
             json=payload,
             headers=headers,
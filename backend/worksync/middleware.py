@@ -124,7 +124,7 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         super().__init__(get_response)
     
     def process_request(self, request):
-        request.start_time = time.time()
+        request.start_time = time.perf_counter()
         
         # Log suspicious requests
         self.check_suspicious_request(request)
@@ -133,7 +133,8 @@ class RequestLoggingMiddleware(MiddlewareMixin):
     
     def process_response(self, request, response):
         # Calculate request duration
-        duration = time.time() - getattr(request, 'start_time', time.time())
+        # perf_counter is monotonic, so wall-clock adjustments can't skew it
+        duration = time.perf_counter() - getattr(request, 'start_time', time.perf_counter())
         
         # Log API requests
         if request.path.startswith('/api/'):
@@ -6,6 +6,26 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext as _
 
 
+# Compiled once at import; validate() runs on every password set/change
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+_LOWERCASE_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_CHAR_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{2,}')
+
+# Common patterns are matched as one alternation, so the lowercased password
+# is scanned once rather than once per pattern
+_COMMON_PATTERNS = (
+    '123',
+    'abc',
+    'password',
+    'admin',
+    'user',
+    'qwerty',
+)
+_COMMON_PATTERN_RE = re.compile('|'.join(map(re.escape, _COMMON_PATTERNS)))
+
+
 class CustomPasswordValidator:
     """
     Custom password validator with enhanced security requirements
@@ -18,38 +38,27 @@ class CustomPasswordValidator:
         errors = []
         
         # Check for at least one uppercase letter
-        if not re.search(r'[A-Z]', password):
+        if not _UPPERCASE_RE.search(password):
             errors.append(_('Password must contain at least one uppercase letter.'))
         
         # Check for at least one lowercase letter
-        if not re.search(r'[a-z]', password):
+        if not _LOWERCASE_RE.search(password):
             errors.append(_('Password must contain at least one lowercase letter.'))
         
         # Check for at least one digit
-        if not re.search(r'\d', password):
+        if not _DIGIT_RE.search(password):
             errors.append(_('Password must contain at least one digit.'))
         
         # Check for at least one special character
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if not _SPECIAL_CHAR_RE.search(password):
             errors.append(_('Password must contain at least one special character (!@#$%^&*(),.?":{}|<>).'))
         
         # Check for common patterns
-        common_patterns = [
-            r'123',
-            r'abc',
-            r'password',
-            r'admin',
-            r'user',
-            r'qwerty',
-        ]
-        
-        for pattern in common_patterns:
-            if re.search(pattern, password.lower()):
-                errors.append(_('Password contains common patterns that are not allowed.'))
-                break
+        if _COMMON_PATTERN_RE.search(password.lower()):
+            errors.append(_('Password contains common patterns that are not allowed.'))
         
         # Check for repeated characters (more than 2 consecutive)
-        if re.search(r'(.)\1{2,}', password):
+        if _REPEATED_CHAR_RE.search(password):
             errors.append(_('Password cannot contain more than 2 consecutive identical characters.'))
         
         if errors: